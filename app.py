@@ -1,226 +1,325 @@
-# --------------------------------------------- #
-# Dashboard Imobiliário em Streamlit
-# Feito para visualizar distribuições de probabilidade
-# Autor: Bruna Petito (2025)
-# --------------------------------------------- #
-
-import streamlit as st
-import numpy as np
-import matplotlib.pyplot as plt
-from scipy.stats import binom, poisson
-import pathlib
-
-# ----------------------------- #
-# Configuração inicial da página
-# ----------------------------- #
-st.set_page_config(page_title="Dashboard Imobiliário", layout="wide")
-
-# Carregar CSS externo (style.css) para deixar o código mais limpo
-css_path = pathlib.Path("style.css")
-if css_path.exists():
-    with open(css_path) as f:
-        st.markdown(f"<style>{f.read()}</style>", unsafe_allow_html=True)
-
-# ----------------------------- #
-# Função auxiliar para criar KPIs
-# (caixinhas que mostram valores de destaque)
-# ----------------------------- #
-def kpi(label, value):
-    st.markdown(f"""
-    <div class="kpi">
-      <div class="label">{label}</div>
-      <div class="value">{value}</div>
-    </div>
-    """, unsafe_allow_html=True)
-
-# ----------------------------- #
-# Título principal do dashboard
-# ----------------------------- #
-st.markdown(
-    "<h1><span class='house'>🏠</span>Dashboard de Distribuições de Probabilidade - Imobiliária</h1>",
-    unsafe_allow_html=True
-)
-
-# ----------------------------- #
-# Criação das abas principais
-# ----------------------------- #
-tab1, tab2, tab3, tab4 = st.tabs(
-    ["📖 Tutorial", "📌 Vendas por Visitas", "📞 Contatos por Dia", "🏡 Vendas por Mês"]
-)
-
-# ----------------------------- #
-# Aba 1 - Tutorial
-# ----------------------------- #
-with tab1:
-    st.header("📖 Como usar este Dashboard")
-    st.markdown("""
-    Este painel foi criado para **donos de imobiliárias** que querem ter uma visão **simples e prática** sobre os números do negócio.
-
-    ### O que você pode fazer aqui:
-    - **📌 Vendas por Visitas** → Descobrir quantos contratos pode esperar fechar a partir das visitas realizadas.  
-    - **📞 Contatos por Dia** → Ver quantos clientes costumam entrar em contato diariamente.  
-    - **🏡 Vendas por Mês** → Registrar a quantidade de imóveis vendidos por mês e as chances de cada cenário.  
-
-    ### Como funciona:
-    1. Ajuste os **controles (sliders e caixas de texto)** de acordo com os dados da sua imobiliária.  
-    2. Veja o **gráfico central** mostrando a chance de cada resultado.  
-    3. Acompanhe os **indicadores (média, variância e desvio padrão)** que resumem os números.  
-    4. Leia a **explicação em destaque** logo abaixo de cada gráfico, que traduz os cálculos em linguagem simples.  
-    """)
-
-# ----------------------------- #
-# Aba 2 - Vendas por Visitas (Distribuição Binomial)
-# ----------------------------- #
-with tab2:
-    st.header("📌 Simulação de Vendas a partir das Visitas")
-    st.write("Aqui dá para estimar **quantos contratos pode fechar** dependendo do número de visitas e da taxa de conversão.")
-
-    with st.container():
-        st.markdown('<div class="block">', unsafe_allow_html=True)
-
-        # Entradas do usuário
-        col_in1, col_in2 = st.columns([1,1])
-        with col_in1:
-            n = st.slider("Quantidade de visitas realizadas", 1, 50, 10)
-        with col_in2:
-            p = st.slider("Chance de fechar contrato por visita (%)", 0, 100, 30, step=1) / 100
-
-        # Distribuição binomial
-        x = np.arange(0, n+1)
-        y = binom.pmf(x, n, p)
-
-        # Gráfico
-        fig, ax = plt.subplots()
-        ax.bar(x, y, color="#8e66c6")
-        ax.set_xlabel("Número de contratos fechados")
-        ax.set_ylabel("Probabilidade")
-        ax.set_title("Distribuição dos contratos")
-        fig.set_size_inches(5, 3)
-
-        # Centralizando o gráfico
-        col_left, col_center, col_right = st.columns([1,2,1])
-        with col_center:
-            st.pyplot(fig)
-
-        # Indicadores (KPIs)
-        col1, col2, col3 = st.columns(3)
-        with col1: kpi("Média esperada", f"{n*p:.2f}")
-        with col2: kpi("Variância", f"{n*p*(1-p):.2f}")
-        with col3: kpi("Desvio Padrão", f"{np.sqrt(n*p*(1-p)):.2f}")
-
-        # Explicação amigável
-        st.info(
-            f"👉 Com **{n} visitas** e **{int(p*100)}% de chance de conversão por visita**, "
-            f"você pode esperar em média **{n*p:.1f} contratos fechados**."
-        )
-
-        st.markdown('</div>', unsafe_allow_html=True)
-
-# ----------------------------- #
-# Aba 3 - Contatos por Dia (Distribuição de Poisson)
-# ----------------------------- #
-with tab3:
-    st.header("📞 Previsão de Contatos de Clientes por Dia")
-    st.write("Aqui dá para prever **quantos clientes vão entrar em contato** em um dia comum.")
-
-    with st.container():
-        st.markdown('<div class="block">', unsafe_allow_html=True)
-
-        # Entrada do usuário
-        lmbda = st.slider("Média de contatos por dia", 1, 20, 5)
-
-        # Distribuição de Poisson
-        x = np.arange(0, lmbda*3)
-        y = poisson.pmf(x, lmbda)
-
-        # Gráfico
-        fig, ax = plt.subplots()
-        ax.bar(x, y, color="#b085f5")
-        ax.set_xlabel("Número de contatos")
-        ax.set_ylabel("Probabilidade")
-        ax.set_title("Distribuição dos contatos diários")
-        fig.set_size_inches(5, 3)
-
-        # Centralizando o gráfico
-        col_left, col_center, col_right = st.columns([1,2,1])
-        with col_center:
-            st.pyplot(fig)
-
-        # Indicadores (KPIs)
-        col1, col2, col3 = st.columns(3)
-        with col1: kpi("Média esperada", f"{lmbda:.2f}")
-        with col2: kpi("Variância", f"{lmbda:.2f}")
-        with col3: kpi("Desvio Padrão", f"{np.sqrt(lmbda):.2f}")
-
-        # Explicação amigável
-        st.info(
-            f"👉 Se em média **{lmbda} clientes** entram em contato por dia, "
-            f"este gráfico mostra a chance de receber mais ou menos contatos."
-        )
-
-        st.markdown('</div>', unsafe_allow_html=True)
-
-# ----------------------------- #
-# Aba 4 - Vendas por Mês (VA Discreta)
-# ----------------------------- #
-with tab4:
-    st.header("🏡 Vendas por Mês")
-    st.write("Aqui você pode registrar **quantos imóveis costuma vender por mês** e visualizar a chance de cada cenário.")
-
-    with st.container():
-        st.markdown('<div class="block">', unsafe_allow_html=True)
-
-        # Entrada do usuário
-        col_in1, col_in2 = st.columns([1,1])
-        with col_in1:
-            valores = st.text_input("Valores possíveis de vendas", "0,1,2,3,4,5")
-        with col_in2:
-            probs = st.text_input("Probabilidades correspondentes", "0.1,0.2,0.3,0.2,0.15,0.05")
-
-        try:
-            # Conversão dos dados
-            valores = [int(v.strip()) for v in valores.split(",")]
-            probs = [float(p.strip()) for p in probs.split(",")]
-
-            # Verifica se as probabilidades somam 1
-            if abs(sum(probs) - 1) > 0.001:
-                st.error("As probabilidades devem somar 1 (100%).")
-            else:
-                # Gráfico
-                fig, ax = plt.subplots()
-                ax.bar(valores, probs, color="#d0bdf4")
-                ax.set_xlabel("Número de imóveis vendidos")
-                ax.set_ylabel("Probabilidade")
-                ax.set_title("Distribuição das vendas mensais")
-                fig.set_size_inches(5, 3)
-
-                # Centralizando o gráfico
-                col_left, col_center, col_right = st.columns([1,2,1])
-                with col_center:
-                    st.pyplot(fig)
-
-                # Cálculos estatísticos
-                media = np.sum([v*p for v, p in zip(valores, probs)])
-                variancia = np.sum([((v - media)**2)*p for v, p in zip(valores, probs)])
-                desvio = np.sqrt(variancia)
-
-                # KPIs
-                col1, col2, col3 = st.columns(3)
-                with col1: kpi("Média esperada", f"{media:.2f}")
-                with col2: kpi("Variância", f"{variancia:.2f}")
-                with col3: kpi("Desvio Padrão", f"{desvio:.2f}")
-
-                # Explicação amigável
-                st.info(
-                    f"👉 Em média, sua imobiliária pode esperar vender **{media:.1f} imóveis por mês**."
-                )
-        except:
-            st.warning("Digite valores válidos para vendas e probabilidades.")
-
-        st.markdown('</div>', unsafe_allow_html=True)
-
-# ----------------------------- #
-# Rodapé
-# ----------------------------- #
-st.markdown("---")
-st.caption("Feito com ❤️ em Streamlit • Petito Imóveis • © 2025")
+# --------------------------------------------- #
+# Dashboard Imobiliário em Streamlit
+# Feito para visualizar distribuições de probabilidade
+# Autor: Bruna Petito (2025)
+# --------------------------------------------- #
+
+import streamlit as st
+import numpy as np
+import pandas as pd
+from scipy.special import gammaln, xlogy
+from numba import njit
+from math import sqrt
+import pathlib
+
+# ----------------------------- #
+# Configuração inicial da página
+# ----------------------------- #
+st.set_page_config(page_title="Dashboard Imobiliário", layout="wide")
+
+# Carregar CSS externo (style.css) para deixar o código mais limpo.
+# O cache evita reler o arquivo a cada interação (todo movimento de slider
+# reexecuta o script inteiro).
+@st.cache_data
+def _load_css(path: str) -> str:
+    css_path = pathlib.Path(path)
+    if css_path.exists():
+        with open(css_path) as f:
+            return f"<style>{f.read()}</style>"
+    return ""
+
+st.markdown(_load_css("style.css"), unsafe_allow_html=True)
+
+# ----------------------------- #
+# Distribuições de probabilidade
+# ----------------------------- #
+# As PMFs são calculadas direto em NumPy (via log-gama), sem passar pela
+# camada genérica de objetos do scipy.stats, que domina o custo para vetores
+# tão pequenos quanto estes (no máximo ~60 pontos).
+# Os sliders têm domínios minúsculos (n até 50, p em passos de 1%, λ até 20),
+# então dá para pré-calcular TODAS as combinações uma única vez por processo
+# e transformar cada interação em uma simples fatia de array.
+@st.cache_resource
+def binom_table():
+    # T[n, p_pct, :n+1] = PMF binomial com n visitas e p = p_pct/100
+    T = np.zeros((51, 101, 51))
+    for n in range(1, 51):
+        x = np.arange(0, n + 1)
+        logc = gammaln(n + 1) - gammaln(x + 1) - gammaln(n - x + 1)
+        for p_pct in range(0, 101):
+            # xlogy trata 0·log(0) direto em C, então os extremos p = 0 e
+            # p = 1 saem certos sem caso especial (toda a massa numa ponta).
+            p = p_pct / 100.0
+            T[n, p_pct, :n + 1] = np.exp(logc + xlogy(x, p) + xlogy(n - x, 1 - p))
+    return T
+
+@st.cache_resource
+def poisson_table():
+    # T[λ, :λ*3] = PMF de Poisson com média λ
+    T = np.zeros((21, 60))
+    for lmbda in range(1, 21):
+        x = np.arange(0, lmbda * 3)
+        T[lmbda, :lmbda * 3] = np.exp(xlogy(x, lmbda) - lmbda - gammaln(x + 1))
+    return T
+
+# A chave é o percentual inteiro do slider, não o float p: índice direto na
+# tabela, sem arredondamento nem comparação de ponto flutuante no caminho.
+def binom_pmf(n: int, p_pct: int):
+    x = np.arange(0, n + 1)
+    return x, binom_table()[n, p_pct, :n + 1]
+
+def poisson_pmf(lmbda: int):
+    x = np.arange(0, lmbda * 3)
+    return x, poisson_table()[lmbda, :lmbda * 3]
+
+# Média e variância da VA discreta em um único laço compilado (sem listas
+# intermediárias). A versão preferida é a pré-compilada (AOT) gerada por
+# `python build_ext.py`, que elimina até o aquecimento do JIT no primeiro
+# uso; sem o binário, cai no @njit com cache=True, que guarda o binário em
+# disco e paga a compilação uma vez só por máquina.
+try:
+    from stats_ext import mean_var
+except ImportError:
+    @njit(cache=True)
+    def mean_var(valores, probs):
+        media = 0.0
+        for i in range(valores.size):
+            media += valores[i] * probs[i]
+        var = 0.0
+        for i in range(valores.size):
+            d = valores[i] - media
+            var += d * d * probs[i]
+        return media, var
+
+# Conversão dos textos da aba 4: o parser do próprio NumPy escreve direto
+# num buffer tipado, sem criar uma lista Python intermediária. Devolve None
+# se o formato for inválido — só a conversão fica protegida, para um erro de
+# digitação não mascarar bugs reais nem disparar o desenho do gráfico.
+def parse_distribuicao(valores_str, probs_str):
+    try:
+        valores = np.fromstring(valores_str, sep=",", dtype=np.int64)
+        probs = np.fromstring(probs_str, sep=",", dtype=np.float64)
+    except ValueError:
+        return None
+    return valores, probs
+
+# ----------------------------- #
+# Função auxiliar para criar KPIs
+# (caixinhas que mostram valores de destaque)
+# ----------------------------- #
+# O bloco HTML é memoizado por (label, value): ao revisitar parâmetros já
+# vistos, o Streamlit recebe a mesma string e o diff vira comparação direta.
+@st.cache_data
+def kpi_html(label: str, value: str) -> str:
+    return f"""
+    <div class="kpi">
+      <div class="label">{label}</div>
+      <div class="value">{value}</div>
+    </div>
+    """
+
+def kpi(label, value):
+    st.markdown(kpi_html(label, value), unsafe_allow_html=True)
+
+# Centraliza um elemento colocando-o na coluna do meio de um layout [1,2,1].
+# Um helper só, em vez do mesmo trio de colunas repetido em cada aba.
+def _centered(fn):
+    _, centro, _ = st.columns([1, 2, 1])
+    with centro:
+        fn()
+
+# ----------------------------- #
+# Título principal do dashboard
+# ----------------------------- #
+st.markdown(
+    "<h1><span class='house'>🏠</span>Dashboard de Distribuições de Probabilidade - Imobiliária</h1>",
+    unsafe_allow_html=True
+)
+
+# ----------------------------- #
+# Criação das abas principais
+# ----------------------------- #
+tab1, tab2, tab3, tab4 = st.tabs(
+    ["📖 Tutorial", "📌 Vendas por Visitas", "📞 Contatos por Dia", "🏡 Vendas por Mês"]
+)
+
+# ----------------------------- #
+# Aba 1 - Tutorial
+# ----------------------------- #
+with tab1:
+    st.header("📖 Como usar este Dashboard")
+    st.markdown("""
+    Este painel foi criado para **donos de imobiliárias** que querem ter uma visão **simples e prática** sobre os números do negócio.
+
+    ### O que você pode fazer aqui:
+    - **📌 Vendas por Visitas** → Descobrir quantos contratos pode esperar fechar a partir das visitas realizadas.  
+    - **📞 Contatos por Dia** → Ver quantos clientes costumam entrar em contato diariamente.  
+    - **🏡 Vendas por Mês** → Registrar a quantidade de imóveis vendidos por mês e as chances de cada cenário.  
+
+    ### Como funciona:
+    1. Ajuste os **controles (sliders e caixas de texto)** de acordo com os dados da sua imobiliária.  
+    2. Veja o **gráfico central** mostrando a chance de cada resultado.  
+    3. Acompanhe os **indicadores (média, variância e desvio padrão)** que resumem os números.  
+    4. Leia a **explicação em destaque** logo abaixo de cada gráfico, que traduz os cálculos em linguagem simples.  
+    """)
+
+# ----------------------------- #
+# Aba 2 - Vendas por Visitas (Distribuição Binomial)
+# ----------------------------- #
+# O decorador st.fragment faz com que mexer nos sliders desta aba reexecute
+# apenas esta função, e não o script inteiro (idem para as abas 3 e 4).
+@st.fragment
+def _tab_binom():
+    st.header("📌 Simulação de Vendas a partir das Visitas")
+    st.write("Aqui dá para estimar **quantos contratos pode fechar** dependendo do número de visitas e da taxa de conversão.")
+
+    with st.container():
+        st.markdown('<div class="block">', unsafe_allow_html=True)
+
+        # Entradas do usuário
+        col_in1, col_in2 = st.columns([1,1])
+        with col_in1:
+            n = st.slider("Quantidade de visitas realizadas", 1, 50, 10)
+        with col_in2:
+            p_pct = st.slider("Chance de fechar contrato por visita (%)", 0, 100, 30, step=1)
+
+        # O percentual inteiro vai direto para a tabela de PMFs; o float p
+        # só existe para os KPIs.
+        p = p_pct / 100.0
+
+        # Distribuição binomial
+        x, y = binom_pmf(n, p_pct)
+
+        # Gráfico: renderizado no navegador (Vega-Lite), o servidor só envia
+        # o vetor de probabilidades em vez de rasterizar um PNG por interação.
+        _centered(lambda: st.bar_chart(
+            pd.DataFrame({"Probabilidade": y}, index=x),
+            color="#8e66c6",
+            x_label="Número de contratos fechados",
+            y_label="Probabilidade",
+        ))
+
+        # Indicadores (KPIs)
+        col1, col2, col3 = st.columns(3)
+        with col1: kpi("Média esperada", f"{n*p:.2f}")
+        with col2: kpi("Variância", f"{n*p*(1-p):.2f}")
+        with col3: kpi("Desvio Padrão", f"{sqrt(n*p*(1-p)):.2f}")
+
+        # Explicação amigável
+        st.info(
+            f"👉 Com **{n} visitas** e **{p_pct}% de chance de conversão por visita**, "
+            f"você pode esperar em média **{n*p:.1f} contratos fechados**."
+        )
+
+        st.markdown('</div>', unsafe_allow_html=True)
+
+with tab2:
+    _tab_binom()
+
+# ----------------------------- #
+# Aba 3 - Contatos por Dia (Distribuição de Poisson)
+# ----------------------------- #
+@st.fragment
+def _tab_poisson():
+    st.header("📞 Previsão de Contatos de Clientes por Dia")
+    st.write("Aqui dá para prever **quantos clientes vão entrar em contato** em um dia comum.")
+
+    with st.container():
+        st.markdown('<div class="block">', unsafe_allow_html=True)
+
+        # Entrada do usuário
+        lmbda = st.slider("Média de contatos por dia", 1, 20, 5)
+
+        # Distribuição de Poisson
+        x, y = poisson_pmf(lmbda)
+
+        # Gráfico renderizado no navegador (ver aba 2)
+        _centered(lambda: st.bar_chart(
+            pd.DataFrame({"Probabilidade": y}, index=x),
+            color="#b085f5",
+            x_label="Número de contatos",
+            y_label="Probabilidade",
+        ))
+
+        # Indicadores (KPIs)
+        col1, col2, col3 = st.columns(3)
+        with col1: kpi("Média esperada", f"{lmbda:.2f}")
+        with col2: kpi("Variância", f"{lmbda:.2f}")
+        with col3: kpi("Desvio Padrão", f"{sqrt(lmbda):.2f}")
+
+        # Explicação amigável
+        st.info(
+            f"👉 Se em média **{lmbda} clientes** entram em contato por dia, "
+            f"este gráfico mostra a chance de receber mais ou menos contatos."
+        )
+
+        st.markdown('</div>', unsafe_allow_html=True)
+
+with tab3:
+    _tab_poisson()
+
+# ----------------------------- #
+# Aba 4 - Vendas por Mês (VA Discreta)
+# ----------------------------- #
+@st.fragment
+def _tab_custom():
+    st.header("🏡 Vendas por Mês")
+    st.write("Aqui você pode registrar **quantos imóveis costuma vender por mês** e visualizar a chance de cada cenário.")
+
+    with st.container():
+        st.markdown('<div class="block">', unsafe_allow_html=True)
+
+        # Entrada do usuário
+        col_in1, col_in2 = st.columns([1,1])
+        with col_in1:
+            valores = st.text_input("Valores possíveis de vendas", "0,1,2,3,4,5")
+        with col_in2:
+            probs = st.text_input("Probabilidades correspondentes", "0.1,0.2,0.3,0.2,0.15,0.05")
+
+        # Conversão dos dados + validação ANTES de qualquer trabalho de
+        # gráfico: entrada malformada sai barata.
+        dados = parse_distribuicao(valores, probs)
+        if dados is None:
+            st.warning("Digite valores válidos para vendas e probabilidades.")
+        elif dados[0].size != dados[1].size:
+            st.error("Informe a mesma quantidade de valores e probabilidades.")
+        elif abs(dados[1].sum() - 1) > 0.001:
+            st.error("As probabilidades devem somar 1 (100%).")
+        else:
+            valores, probs = dados
+
+            # Gráfico renderizado no navegador (ver aba 2)
+            _centered(lambda: st.bar_chart(
+                pd.DataFrame({"Probabilidade": probs}, index=valores),
+                color="#d0bdf4",
+                x_label="Número de imóveis vendidos",
+                y_label="Probabilidade",
+            ))
+
+            # Cálculos estatísticos
+            media, variancia = mean_var(valores, probs)
+            # math.sqrt é uma chamada C direta; np.sqrt num escalar
+            # passaria pelo dispatch de ufunc do NumPy à toa.
+            desvio = sqrt(variancia)
+
+            # KPIs
+            col1, col2, col3 = st.columns(3)
+            with col1: kpi("Média esperada", f"{media:.2f}")
+            with col2: kpi("Variância", f"{variancia:.2f}")
+            with col3: kpi("Desvio Padrão", f"{desvio:.2f}")
+
+            # Explicação amigável
+            st.info(
+                f"👉 Em média, sua imobiliária pode esperar vender **{media:.1f} imóveis por mês**."
+            )
+
+        st.markdown('</div>', unsafe_allow_html=True)
+
+with tab4:
+    _tab_custom()
+
+# ----------------------------- #
+# Rodapé
+# ----------------------------- #
+st.markdown("---")
+st.caption("Feito com ❤️ em Streamlit • Petito Imóveis • © 2025")
@@ -0,0 +1,25 @@
+# --------------------------------------------- #
+# Compilação antecipada (AOT) do kernel estatístico
+# Rodar `python build_ext.py` gera o módulo stats_ext,
+# que o app.py importa no lugar da versão @njit. Assim
+# a primeira interação após o boot do servidor não paga
+# o tempo de compilação do JIT.
+# --------------------------------------------- #
+
+from numba.pycc import CC
+
+cc = CC("stats_ext")
+
+@cc.export("mean_var", "UniTuple(f8, 2)(i8[:], f8[:])")
+def mean_var(valores, probs):
+    media = 0.0
+    for i in range(valores.size):
+        media += valores[i] * probs[i]
+    var = 0.0
+    for i in range(valores.size):
+        d = valores[i] - media
+        var += d * d * probs[i]
+    return media, var
+
+if __name__ == "__main__":
+    cc.compile()